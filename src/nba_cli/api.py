@@ -1,18 +1,57 @@
 """NBA API client for fetching schedule data."""
 
 import logging
+import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, time
+from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .config import NBA_TEAMS
+from .config import NBA_TEAMS, get_cache_dir, json_dumps, json_loads, write_atomic
 
 logger = logging.getLogger(__name__)
 
+# Season type labels, shared so every Game references the same objects
+REGULAR_SEASON = "Regular Season"
+PLAYOFFS = "Playoffs"
+PLAY_IN = "Play-In"
 
-@dataclass
+# Used when the feed has a date but no tip-off time
+_DEFAULT_TIPOFF = time(19, 30)
+
+# Series text for playoff games; checked before Play-In
+_PLAYOFF_SERIES_RE = re.compile(r"Playoff|Finals")
+
+
+def _build_session() -> requests.Session:
+    """Create an HTTP session with keep-alive pooling and retry/backoff."""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json",
+        "Referer": "https://www.nba.com/",
+    })
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across clients so connections and DNS lookups are reused
+_SESSION = _build_session()
+
+
+@dataclass(frozen=True, slots=True)
 class Game:
     """Represents an NBA game."""
     game_id: str
@@ -30,7 +69,7 @@ class Game:
     arena_state: Optional[str] = None
     completed: bool = False
     season: str = ""
-    season_type: str = "Regular Season"
+    season_type: str = REGULAR_SEASON
     
     @property
     def matchup(self) -> str:
@@ -63,22 +102,58 @@ class Game:
 class NBAClient:
     """Client for fetching NBA schedule data."""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-            "Referer": "https://www.nba.com/",
-        })
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.session = _SESSION
+        self.cache_dir = cache_dir or get_cache_dir()
+    
+    def _fetch_schedule_data(self, url: str, season_year: int) -> dict:
+        """
+        Fetch the raw schedule JSON, revalidating any cached copy.
+        
+        The feed changes at most a few times a day, so the last response is
+        kept on disk with its ETag/Last-Modified headers and re-requested
+        conditionally. A 304 reuses the cached body without a download.
+        """
+        data_path = self.cache_dir / f"schedule_{season_year}.json"
+        meta_path = self.cache_dir / f"schedule_{season_year}.meta.json"
+        
+        headers = {}
+        try:
+            meta = json_loads(meta_path.read_bytes()) if data_path.exists() else {}
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            logger.info(f"Schedule unchanged, using cached copy at {data_path}")
+            return json_loads(data_path.read_bytes())
+        
+        response.raise_for_status()
+        data = json_loads(response.content)
+        
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(data_path, response.content)
+            write_atomic(meta_path, json_dumps(meta))
+        except OSError as e:
+            logger.warning(f"Failed to cache schedule: {e}")
+        
+        return data
     
     def get_full_schedule(self, season_year: int) -> list[Game]:
         url = f"https://data.nba.com/data/10s/v2015/json/mobile_teams/nba/{season_year}/league/00_full_schedule.json"
         logger.info(f"Fetching full schedule from {url}")
         
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_schedule_data(url, season_year)
         except Exception as e:
             logger.error(f"Failed to fetch schedule: {e}")
             return []
@@ -102,13 +177,15 @@ class NBAClient:
             game_date_str = game_data.get("gdte", "")
             game_time_str = game_data.get("etm", "")
             
+            # etm/gdte are ISO-8601, so skip strptime's format interpretation
+            game_date = None
             if game_time_str:
                 try:
-                    game_date = datetime.strptime(game_time_str, "%Y-%m-%dT%H:%M:%S")
+                    game_date = datetime.fromisoformat(game_time_str)
                 except ValueError:
-                    game_date = datetime.strptime(game_date_str, "%Y-%m-%d").replace(hour=19, minute=30)
-            else:
-                game_date = datetime.strptime(game_date_str, "%Y-%m-%d").replace(hour=19, minute=30)
+                    pass
+            if game_date is None:
+                game_date = datetime.combine(date.fromisoformat(game_date_str), _DEFAULT_TIPOFF)
             
             visitor = game_data.get("v", {})
             away_team_id = visitor.get("tid", 0)
@@ -133,13 +210,16 @@ class NBAClient:
             status = game_data.get("st", 1)
             completed = status == 3
             
+            # Regular season games carry no series text, so skip the scans
             seri = game_data.get("seri", "")
-            if "Playoff" in seri or "Finals" in seri:
-                season_type = "Playoffs"
+            if not seri:
+                season_type = REGULAR_SEASON
+            elif _PLAYOFF_SERIES_RE.search(seri):
+                season_type = PLAYOFFS
             elif "Play-In" in seri:
-                season_type = "Play-In"
+                season_type = PLAY_IN
             else:
-                season_type = "Regular Season"
+                season_type = REGULAR_SEASON
             
             return Game(
                 game_id=str(game_id),
@@ -170,21 +250,17 @@ class NBAClient:
         include_preseason: bool = False,
         include_playoffs: bool = True,
     ) -> list[Game]:
+        """Get the season's games, optionally filtered to teams, sorted by date."""
         season_year = int(season.split("-")[0])
         all_games = self.get_full_schedule(season_year)
         
         if team_ids:
-            filtered = []
-            seen = set()
-            for g in all_games:
-                if g.game_id in seen:
-                    continue
-                for team_id in team_ids:
-                    if g.involves_team_id(team_id):
-                        seen.add(g.game_id)
-                        filtered.append(g)
-                        break
-            all_games = filtered
+            # get_full_schedule yields each game once, so no dedup is needed
+            team_set = frozenset(team_ids)
+            all_games = [
+                g for g in all_games
+                if g.home_team_id in team_set or g.away_team_id in team_set
+            ]
         
         all_games.sort(key=lambda g: g.game_date)
         logger.info(f"Returning {len(all_games)} games")
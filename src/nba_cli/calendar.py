@@ -1,22 +1,108 @@
 """Calendar generation for NBA schedules."""
 
-import hashlib
 import logging
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from icalendar import Calendar, Event, Alarm
 
-from .api import Game
-from .config import NBA_TEAMS, get_team_by_abbrev, get_calendars_dir
+from .api import PLAYOFFS, REGULAR_SEASON, Game
+from .config import NBA_TEAMS, NBA_CONFERENCES, NBA_DIVISIONS, get_team_by_abbrev, get_calendars_dir
 
 logger = logging.getLogger(__name__)
 
+# Team membership tables, built once so per-game filtering is a set probe
+_CONF_TEAMS: dict[str, frozenset[str]] = {
+    conf: frozenset(abbrev for abbrev, info in NBA_TEAMS.items() if info["conference"] == conf)
+    for conf in NBA_CONFERENCES
+}
+_DIV_TEAMS: dict[str, frozenset[str]] = {
+    div: frozenset(abbrev for abbrev, info in NBA_TEAMS.items() if info["division"] == div)
+    for divs in NBA_DIVISIONS.values()
+    for div in divs
+}
+
+_CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+
+def _new_calendar(name: str) -> Calendar:
+    """Create an empty calendar with the standard NBA CLI properties."""
+    cal = Calendar()
+    cal.add("prodid", "-//NBA CLI//nba-cli//EN")
+    cal.add("version", "2.0")
+    cal.add("calscale", "GREGORIAN")
+    cal.add("method", "PUBLISH")
+    cal.add("x-wr-calname", name)
+    cal.add("x-wr-timezone", "America/New_York")
+    return cal
+
+
+def _iter_calendar_ical(
+    cal: Calendar,
+    ical_cache: Optional[dict[str, bytes]] = None,
+) -> Iterator[bytes]:
+    """
+    Yield a calendar's ICS bytes in chunks, reusing serialized events.
+    
+    The same game shows up in several calendars (both teams, conference,
+    division, combined), so events are serialized once per UID and the
+    bytes are emitted between the calendar header and footer.
+    
+    Args:
+        cal: Calendar to serialize
+        ical_cache: Optional UID -> event bytes cache shared across calendars
+    """
+    header = Calendar()
+    header.update(cal)
+    yield header.to_ical()[:-len(_CALENDAR_FOOTER)]
+    
+    for component in cal.subcomponents:
+        uid = component.get("uid")
+        if ical_cache is None or uid is None:
+            yield component.to_ical()
+            continue
+        key = str(uid)
+        if key not in ical_cache:
+            ical_cache[key] = component.to_ical()
+        yield ical_cache[key]
+    
+    yield _CALENDAR_FOOTER
+
+
+def _index_games(
+    games: list[Game],
+) -> tuple[dict[str, list[Game]], dict[str, list[Game]], dict[str, list[Game]]]:
+    """
+    Group games by team, conference, and division in a single pass.
+    
+    Each game is listed at most once per key and input order is kept.
+    
+    Returns:
+        (by_team, by_conference, by_division) mappings
+    """
+    by_team: dict[str, list[Game]] = defaultdict(list)
+    by_conf: dict[str, list[Game]] = defaultdict(list)
+    by_div: dict[str, list[Game]] = defaultdict(list)
+    
+    for game in games:
+        teams = {game.home_team, game.away_team}
+        infos = [NBA_TEAMS[t] for t in teams if t in NBA_TEAMS]
+        for team in teams:
+            by_team[team].append(game)
+        for conf in {info["conference"] for info in infos}:
+            by_conf[conf].append(game)
+        for div in {info["division"] for info in infos}:
+            by_div[div].append(game)
+    
+    return by_team, by_conf, by_div
+
 
 def create_game_event(
     game: Game,
     reminder_minutes: int = 60,
+    now: Optional[datetime] = None,
 ) -> Event:
     """
     Create an iCalendar event for a game.
@@ -24,13 +110,12 @@ def create_game_event(
     Args:
         game: Game object
         reminder_minutes: Minutes before game to trigger reminder
+        now: Timestamp for DTSTAMP/CREATED (defaults to current UTC time)
     """
     event = Event()
     
-    # Create unique ID
-    uid_base = f"nba-{game.season}-{game.game_id}"
-    uid = hashlib.md5(uid_base.encode()).hexdigest()
-    event.add("uid", f"{uid}@nba-cli")
+    # Create unique ID (season + game ID is already unique and stable)
+    event.add("uid", f"nba-{game.season}-{game.game_id}@nba-cli")
     
     # Title
     if game.completed and game.home_score is not None and game.away_score is not None:
@@ -53,7 +138,7 @@ def create_game_event(
         f"Season: {game.season}",
     ]
     
-    if game.season_type != "Regular Season":
+    if game.season_type != REGULAR_SEASON:
         description_parts.append(f"Type: {game.season_type}")
     
     if game.completed:
@@ -64,7 +149,7 @@ def create_game_event(
     
     # Categories
     categories = ["NBA", "Basketball"]
-    if game.season_type == "Playoffs":
+    if game.season_type == PLAYOFFS:
         categories.append("Playoffs")
     event.add("categories", categories)
     
@@ -83,17 +168,36 @@ def create_game_event(
         event.add_component(alarm)
     
     # Timestamps
-    event.add("dtstamp", datetime.now())
-    event.add("created", datetime.now())
+    if now is None:
+        now = datetime.now(timezone.utc)
+    event.add("dtstamp", now)
+    event.add("created", now)
     
     return event
 
 
+def _pooled_event(
+    game: Game,
+    reminder_minutes: int,
+    now: Optional[datetime],
+    events: Optional[dict[str, Event]],
+) -> Event:
+    """Return the event for a game from the shared pool, creating it once."""
+    if events is None:
+        return create_game_event(game, reminder_minutes, now)
+    event = events.get(game.game_id)
+    if event is None:
+        event = events[game.game_id] = create_game_event(game, reminder_minutes, now)
+    return event
+
+
 def generate_team_calendar(
     games: list[Game],
     team_abbrev: str,
     calendar_name: Optional[str] = None,
     reminder_minutes: int = 60,
+    now: Optional[datetime] = None,
+    events: Optional[dict[str, Event]] = None,
 ) -> Calendar:
     """
     Generate a calendar for a specific team.
@@ -103,24 +207,23 @@ def generate_team_calendar(
         team_abbrev: Team abbreviation (e.g., "LAL")
         calendar_name: Optional custom calendar name
         reminder_minutes: Minutes before game for reminder
+        now: Timestamp shared by all events (defaults to current UTC time)
+        events: Optional game ID -> Event pool shared across calendars
     """
     team_info = get_team_by_abbrev(team_abbrev)
     if not team_info:
         raise ValueError(f"Unknown team: {team_abbrev}")
     
-    cal = Calendar()
-    cal.add("prodid", "-//NBA CLI//nba-cli//EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "PUBLISH")
-    cal.add("x-wr-calname", calendar_name or f"NBA - {team_info['name']}")
-    cal.add("x-wr-timezone", "America/New_York")
+    cal = _new_calendar(calendar_name or f"NBA - {team_info['name']}")
     
     # Filter games for this team
-    team_games = [g for g in games if g.involves_team(team_abbrev)]
+    abbrev = team_abbrev.upper()
+    team_games = [g for g in games if g.home_team == abbrev or g.away_team == abbrev]
     
+    if now is None:
+        now = datetime.now(timezone.utc)
     for game in team_games:
-        event = create_game_event(game, reminder_minutes)
+        event = _pooled_event(game, reminder_minutes, now, events)
         cal.add_component(event)
     
     logger.info(f"Created calendar with {len(team_games)} events for {team_abbrev}")
@@ -132,6 +235,8 @@ def generate_conference_calendar(
     conference: str,
     calendar_name: Optional[str] = None,
     reminder_minutes: int = 60,
+    now: Optional[datetime] = None,
+    events: Optional[dict[str, Event]] = None,
 ) -> Calendar:
     """
     Generate a calendar for a conference.
@@ -141,20 +246,15 @@ def generate_conference_calendar(
         conference: Conference name ("East" or "West")
         calendar_name: Optional custom calendar name
         reminder_minutes: Minutes before game for reminder
+        now: Timestamp shared by all events (defaults to current UTC time)
+        events: Optional game ID -> Event pool shared across calendars
     """
     conf = conference.capitalize()
     
-    cal = Calendar()
-    cal.add("prodid", "-//NBA CLI//nba-cli//EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "PUBLISH")
-    cal.add("x-wr-calname", calendar_name or f"NBA - {conf}ern Conference")
-    cal.add("x-wr-timezone", "America/New_York")
+    cal = _new_calendar(calendar_name or f"NBA - {conf}ern Conference")
     
     # Get teams in this conference
-    conf_teams = [abbrev for abbrev, info in NBA_TEAMS.items() 
-                  if info["conference"] == conf]
+    conf_teams = _CONF_TEAMS.get(conf, frozenset())
     
     # Filter games where at least one team is from this conference
     conf_games = []
@@ -166,8 +266,10 @@ def generate_conference_calendar(
             conf_games.append(game)
             seen_ids.add(game.game_id)
     
+    if now is None:
+        now = datetime.now(timezone.utc)
     for game in conf_games:
-        event = create_game_event(game, reminder_minutes)
+        event = _pooled_event(game, reminder_minutes, now, events)
         cal.add_component(event)
     
     logger.info(f"Created calendar with {len(conf_games)} events for {conf}ern Conference")
@@ -179,6 +281,8 @@ def generate_division_calendar(
     division: str,
     calendar_name: Optional[str] = None,
     reminder_minutes: int = 60,
+    now: Optional[datetime] = None,
+    events: Optional[dict[str, Event]] = None,
 ) -> Calendar:
     """
     Generate a calendar for a division.
@@ -188,20 +292,15 @@ def generate_division_calendar(
         division: Division name (e.g., "Atlantic", "Pacific")
         calendar_name: Optional custom calendar name
         reminder_minutes: Minutes before game for reminder
+        now: Timestamp shared by all events (defaults to current UTC time)
+        events: Optional game ID -> Event pool shared across calendars
     """
     div = division.capitalize()
     
-    cal = Calendar()
-    cal.add("prodid", "-//NBA CLI//nba-cli//EN")
-    cal.add("version", "2.0")
-    cal.add("calscale", "GREGORIAN")
-    cal.add("method", "PUBLISH")
-    cal.add("x-wr-calname", calendar_name or f"NBA - {div} Division")
-    cal.add("x-wr-timezone", "America/New_York")
+    cal = _new_calendar(calendar_name or f"NBA - {div} Division")
     
     # Get teams in this division
-    div_teams = [abbrev for abbrev, info in NBA_TEAMS.items() 
-                 if info["division"] == div]
+    div_teams = _DIV_TEAMS.get(div, frozenset())
     
     # Filter games where at least one team is from this division
     div_games = []
@@ -213,20 +312,34 @@ def generate_division_calendar(
             div_games.append(game)
             seen_ids.add(game.game_id)
     
+    if now is None:
+        now = datetime.now(timezone.utc)
     for game in div_games:
-        event = create_game_event(game, reminder_minutes)
+        event = _pooled_event(game, reminder_minutes, now, events)
         cal.add_component(event)
     
     logger.info(f"Created calendar with {len(div_games)} events for {div} Division")
     return cal
 
 
-def export_calendar(cal: Calendar, filepath: Path) -> None:
-    """Export calendar to ICS file."""
+def export_calendar(
+    cal: Calendar,
+    filepath: Path,
+    ical_cache: Optional[dict[str, bytes]] = None,
+) -> None:
+    """
+    Export calendar to ICS file.
+    
+    Args:
+        cal: Calendar to export
+        filepath: Destination .ics path
+        ical_cache: Optional UID -> event bytes cache shared across exports
+    """
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(filepath, "wb") as f:
-        f.write(cal.to_ical())
+    # Stream chunks instead of building the whole calendar in memory
+    with open(filepath, "wb", buffering=1 << 20) as f:
+        f.writelines(_iter_calendar_ical(cal, ical_cache))
     
     logger.info(f"Exported calendar to {filepath}")
 
@@ -252,13 +365,22 @@ class CalendarManager:
         Returns list of generated file paths.
         """
         generated = []
+        # One timestamp for the whole batch; each game's event is built
+        # and serialized once no matter how many calendars include it
+        now = datetime.now(timezone.utc)
+        events: dict[str, Event] = {}
+        ical_cache: dict[str, bytes] = {}
+        by_team, by_conf, by_div = _index_games(games)
         
         # Generate team calendars
         for abbrev in tracked_teams:
             try:
-                cal = generate_team_calendar(games, abbrev, reminder_minutes=reminder_minutes)
+                cal = generate_team_calendar(
+                    by_team.get(abbrev.upper(), []), abbrev,
+                    reminder_minutes=reminder_minutes, now=now, events=events,
+                )
                 filepath = self.output_dir / f"nba_{abbrev.lower()}.ics"
-                export_calendar(cal, filepath)
+                export_calendar(cal, filepath, ical_cache)
                 generated.append(filepath)
             except Exception as e:
                 logger.error(f"Error generating calendar for {abbrev}: {e}")
@@ -266,9 +388,12 @@ class CalendarManager:
         # Generate conference calendars
         for conf in tracked_conferences:
             try:
-                cal = generate_conference_calendar(games, conf, reminder_minutes=reminder_minutes)
+                cal = generate_conference_calendar(
+                    by_conf.get(conf.capitalize(), []), conf,
+                    reminder_minutes=reminder_minutes, now=now, events=events,
+                )
                 filepath = self.output_dir / f"nba_{conf.lower()}.ics"
-                export_calendar(cal, filepath)
+                export_calendar(cal, filepath, ical_cache)
                 generated.append(filepath)
             except Exception as e:
                 logger.error(f"Error generating calendar for {conf}: {e}")
@@ -276,9 +401,12 @@ class CalendarManager:
         # Generate division calendars
         for div in tracked_divisions:
             try:
-                cal = generate_division_calendar(games, div, reminder_minutes=reminder_minutes)
+                cal = generate_division_calendar(
+                    by_div.get(div.capitalize(), []), div,
+                    reminder_minutes=reminder_minutes, now=now, events=events,
+                )
                 filepath = self.output_dir / f"nba_{div.lower()}.ics"
-                export_calendar(cal, filepath)
+                export_calendar(cal, filepath, ical_cache)
                 generated.append(filepath)
             except Exception as e:
                 logger.error(f"Error generating calendar for {div}: {e}")
@@ -286,24 +414,18 @@ class CalendarManager:
         # Generate combined calendar if tracking anything
         if tracked_teams or tracked_conferences or tracked_divisions:
             try:
-                cal = Calendar()
-                cal.add("prodid", "-//NBA CLI//nba-cli//EN")
-                cal.add("version", "2.0")
-                cal.add("calscale", "GREGORIAN")
-                cal.add("method", "PUBLISH")
-                cal.add("x-wr-calname", "NBA Schedule")
-                cal.add("x-wr-timezone", "America/New_York")
+                cal = _new_calendar("NBA Schedule")
                 
                 seen_ids = set()
                 for game in games:
                     if game.game_id in seen_ids:
                         continue
                     seen_ids.add(game.game_id)
-                    event = create_game_event(game, reminder_minutes)
+                    event = _pooled_event(game, reminder_minutes, now, events)
                     cal.add_component(event)
                 
                 filepath = self.output_dir / "nba_schedule.ics"
-                export_calendar(cal, filepath)
+                export_calendar(cal, filepath, ical_cache)
                 generated.append(filepath)
                 
                 logger.info(f"Created combined calendar with {len(seen_ids)} events")
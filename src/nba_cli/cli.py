@@ -1,5 +1,8 @@
 """Command-line interface for NBA CLI."""
 
+import bisect
+import copy
+import functools
 import logging
 import sys
 from datetime import datetime
@@ -7,23 +10,24 @@ from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
 
-from .api import NBAClient
-from .calendar import CalendarManager
 from .config import (
     Config,
-    NBA_TEAMS,
     NBA_CONFERENCES,
     NBA_DIVISIONS,
-    get_team_by_name,
+    filter_teams,
+    parse_conference,
+    parse_division,
     get_team_by_abbrev,
+    resolve_team_abbrev,
     get_teams_by_conference,
     get_teams_by_division,
+    config_exists,
     load_config,
+    load_season,
     save_config,
-    get_config_path,
+    get_config_dir,
     get_calendars_dir,
 )
 
@@ -37,6 +41,14 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _client():
+    """Get the process-wide NBAClient (and its pooled HTTP session)."""
+    from .api import NBAClient
+    
+    return NBAClient()
+
+
 @click.group()
 @click.option("--debug", is_flag=True, help="Enable debug logging")
 def cli(debug: bool):
@@ -55,6 +67,7 @@ def init():
     ))
     
     config = load_config()
+    original = copy.deepcopy(config)
     
     # Season
     current = Config.get_current_season()
@@ -75,24 +88,16 @@ def init():
         teams_input = click.prompt("Teams", default="")
         
         if teams_input:
+            tokens = [t.strip() for t in teams_input.split(",")]
             teams = []
-            for t in teams_input.split(","):
-                t = t.strip()
-                if not t:
-                    continue
-                
-                # Try abbreviation first
-                if get_team_by_abbrev(t):
-                    teams.append(t.upper())
+            for t in filter(None, tokens):
+                abbrev = resolve_team_abbrev(t)
+                if abbrev:
+                    teams.append(abbrev)
                 else:
-                    # Try name match
-                    result = get_team_by_name(t)
-                    if result:
-                        teams.append(result[0])
-                    else:
-                        console.print(f"[yellow]Unknown team: {t}[/yellow]")
+                    console.print(f"[yellow]Unknown team: {t}[/yellow]")
             
-            config.tracked.teams = teams
+            config.tracked.teams = set(teams)
     
     if choice in [2, 4]:
         console.print("\n[bold]Select conferences:[/bold]")
@@ -102,10 +107,10 @@ def init():
         if conf_input:
             confs = []
             for c in conf_input.split(","):
-                c = c.strip().capitalize()
-                if c in ["East", "West"]:
-                    confs.append(c)
-            config.tracked.conferences = confs
+                conf = parse_conference(c)
+                if conf:
+                    confs.append(conf.value)
+            config.tracked.conferences = set(confs)
     
     if choice in [3, 4]:
         console.print("\n[bold]Select divisions:[/bold]")
@@ -114,16 +119,20 @@ def init():
         div_input = click.prompt("Divisions (comma-separated)", default="")
         
         if div_input:
-            all_divs = ["Atlantic", "Central", "Southeast", "Northwest", "Pacific", "Southwest"]
             divs = []
             for d in div_input.split(","):
-                d = d.strip().capitalize()
-                if d in all_divs:
-                    divs.append(d)
-            config.tracked.divisions = divs
+                div = parse_division(d)
+                if div:
+                    divs.append(div.value)
+            config.tracked.divisions = set(divs)
+    
+    # Nothing to write if the answers match what is already on disk
+    if config == original and config_exists():
+        console.print(f"\n[green]Configuration unchanged ({get_config_dir()})[/green]")
+        return
     
     save_config(config)
-    console.print(f"\n[green]Configuration saved to {get_config_path()}[/green]")
+    console.print(f"\n[green]Configuration saved to {get_config_dir()}[/green]")
 
 
 @cli.command()
@@ -132,21 +141,15 @@ def init():
 @click.option("-s", "--search", help="Search by team name")
 def teams(conference: str, division: str, search: str):
     """List all NBA teams."""
+    from rich.table import Table
+    
     table = Table(title="NBA Teams")
     table.add_column("Abbrev", style="cyan")
     table.add_column("Team Name", style="white")
     table.add_column("Conference", style="green")
     table.add_column("Division", style="yellow")
     
-    for abbrev, info in sorted(NBA_TEAMS.items(), key=lambda x: (x[1]["conference"], x[1]["division"], x[1]["name"])):
-        # Apply filters
-        if conference and info["conference"].lower() != conference.lower():
-            continue
-        if division and info["division"].lower() != division.lower():
-            continue
-        if search and search.lower() not in info["name"].lower() and search.lower() != abbrev.lower():
-            continue
-        
+    for abbrev, info in filter_teams(conference, division, search):
         table.add_row(
             abbrev,
             info["name"],
@@ -177,41 +180,38 @@ def track(team: str):
     config = load_config()
     
     # Check if it's a conference
-    if team.capitalize() in ["East", "West"]:
-        if team.capitalize() not in config.tracked.conferences:
-            config.tracked.conferences.append(team.capitalize())
+    conf = parse_conference(team)
+    if conf:
+        conf = conf.value
+        if conf not in config.tracked.conferences:
+            config.tracked.conferences.add(conf)
             save_config(config)
-            console.print(f"[green]Now tracking {team.capitalize()}ern Conference[/green]")
+            console.print(f"[green]Now tracking {conf}ern Conference[/green]")
         else:
-            console.print(f"[yellow]Already tracking {team.capitalize()}ern Conference[/yellow]")
+            console.print(f"[yellow]Already tracking {conf}ern Conference[/yellow]")
         return
     
     # Check if it's a division
-    all_divs = ["Atlantic", "Central", "Southeast", "Northwest", "Pacific", "Southwest"]
-    for div in all_divs:
-        if team.lower() == div.lower():
-            if div not in config.tracked.divisions:
-                config.tracked.divisions.append(div)
-                save_config(config)
-                console.print(f"[green]Now tracking {div} Division[/green]")
-            else:
-                console.print(f"[yellow]Already tracking {div} Division[/yellow]")
-            return
+    div = parse_division(team)
+    if div:
+        div = div.value
+        if div not in config.tracked.divisions:
+            config.tracked.divisions.add(div)
+            save_config(config)
+            console.print(f"[green]Now tracking {div} Division[/green]")
+        else:
+            console.print(f"[yellow]Already tracking {div} Division[/yellow]")
+        return
     
     # Try as team
-    if get_team_by_abbrev(team):
-        abbrev = team.upper()
-    else:
-        result = get_team_by_name(team)
-        if result:
-            abbrev = result[0]
-        else:
-            console.print(f"[red]Unknown team: {team}[/red]")
-            console.print("Use 'nba-cli teams' to see available teams")
-            return
+    abbrev = resolve_team_abbrev(team)
+    if not abbrev:
+        console.print(f"[red]Unknown team: {team}[/red]")
+        console.print("Use 'nba-cli teams' to see available teams")
+        return
     
     if abbrev not in config.tracked.teams:
-        config.tracked.teams.append(abbrev)
+        config.tracked.teams.add(abbrev)
         save_config(config)
         team_info = get_team_by_abbrev(abbrev)
         console.print(f"[green]Now tracking {team_info['name']} ({abbrev})[/green]")
@@ -227,26 +227,23 @@ def untrack(team: str):
     config = load_config()
     
     # Check conferences
-    if team.capitalize() in config.tracked.conferences:
-        config.tracked.conferences.remove(team.capitalize())
+    conf = parse_conference(team)
+    if conf and conf.value in config.tracked.conferences:
+        config.tracked.conferences.remove(conf.value)
         save_config(config)
-        console.print(f"[green]Removed {team.capitalize()}ern Conference from tracking[/green]")
+        console.print(f"[green]Removed {conf.value}ern Conference from tracking[/green]")
         return
     
     # Check divisions
-    for div in config.tracked.divisions:
-        if team.lower() == div.lower():
-            config.tracked.divisions.remove(div)
-            save_config(config)
-            console.print(f"[green]Removed {div} Division from tracking[/green]")
-            return
+    div = parse_division(team)
+    if div and div.value in config.tracked.divisions:
+        config.tracked.divisions.remove(div.value)
+        save_config(config)
+        console.print(f"[green]Removed {div.value} Division from tracking[/green]")
+        return
     
     # Try as team
-    abbrev = team.upper() if get_team_by_abbrev(team) else None
-    if not abbrev:
-        result = get_team_by_name(team)
-        if result:
-            abbrev = result[0]
+    abbrev = resolve_team_abbrev(team)
     
     if abbrev and abbrev in config.tracked.teams:
         config.tracked.teams.remove(abbrev)
@@ -264,7 +261,7 @@ def status():
     
     console.print(Panel.fit(
         f"[bold]NBA CLI Configuration[/bold]\n"
-        f"Config file: {get_config_path()}",
+        f"Config dir: {get_config_dir()}",
         border_style="blue"
     ))
     
@@ -272,19 +269,19 @@ def status():
     
     if config.tracked.teams:
         console.print(f"\n[bold]Tracked Teams:[/bold]")
-        for abbrev in config.tracked.teams:
+        for abbrev in sorted(config.tracked.teams):
             info = get_team_by_abbrev(abbrev)
             if info:
                 console.print(f"  - {info['name']} ({abbrev})")
     
     if config.tracked.conferences:
         console.print(f"\n[bold]Tracked Conferences:[/bold]")
-        for conf in config.tracked.conferences:
+        for conf in sorted(config.tracked.conferences):
             console.print(f"  - {conf}ern Conference")
     
     if config.tracked.divisions:
         console.print(f"\n[bold]Tracked Divisions:[/bold]")
-        for div in config.tracked.divisions:
+        for div in sorted(config.tracked.divisions):
             console.print(f"  - {div} Division")
     
     if config.tracked.is_empty():
@@ -296,6 +293,8 @@ def status():
 @click.option("--include-playoffs/--no-playoffs", default=True, help="Include playoff games")
 def sync(include_preseason: bool, include_playoffs: bool):
     """Fetch schedule and generate calendar files."""
+    from .calendar import CalendarManager
+    
     config = load_config()
     
     if config.tracked.is_empty():
@@ -304,7 +303,7 @@ def sync(include_preseason: bool, include_playoffs: bool):
     
     console.print(f"Fetching {config.season} schedule...")
     
-    client = NBAClient()
+    client = _client()
     team_ids = config.tracked.get_all_team_ids()
     
     games = client.get_full_season_schedule(
@@ -325,9 +324,9 @@ def sync(include_preseason: bool, include_playoffs: bool):
     manager = CalendarManager()
     generated = manager.generate_all(
         games=games,
-        tracked_teams=config.tracked.teams,
-        tracked_conferences=config.tracked.conferences,
-        tracked_divisions=config.tracked.divisions,
+        tracked_teams=sorted(config.tracked.teams),
+        tracked_conferences=sorted(config.tracked.conferences),
+        tracked_divisions=sorted(config.tracked.divisions),
     )
     
     console.print(f"\nGenerated {len(generated)} calendar file(s):")
@@ -345,13 +344,17 @@ def sync(include_preseason: bool, include_playoffs: bool):
 @click.option("-n", "--limit", default=10, help="Number of games to show")
 def schedule(limit: int):
     """View upcoming games."""
+    from rich.table import Table
+    
+    from .api import REGULAR_SEASON
+    
     config = load_config()
     
     if config.tracked.is_empty():
         console.print("[yellow]No teams tracked. Use 'nba-cli track <team>' first.[/yellow]")
         return
     
-    client = NBAClient()
+    client = _client()
     team_ids = config.tracked.get_all_team_ids()
     
     console.print(f"Fetching schedule for {config.season}...")
@@ -361,9 +364,10 @@ def schedule(limit: int):
         team_ids=team_ids if team_ids else None,
     )
     
-    # Filter to upcoming games
+    # Games come back sorted by date, so binary search for the first upcoming one
     now = datetime.now()
-    upcoming = [g for g in games if g.game_date >= now][:limit]
+    start = bisect.bisect_left(games, now, key=lambda g: g.game_date)
+    upcoming = games[start:start + limit]
     
     if not upcoming:
         console.print("[yellow]No upcoming games found.[/yellow]")
@@ -380,7 +384,7 @@ def schedule(limit: int):
             game.game_date.strftime("%a %b %d"),
             game.game_date.strftime("%I:%M %p"),
             game.matchup_full,
-            game.season_type if game.season_type != "Regular Season" else "",
+            game.season_type if game.season_type != REGULAR_SEASON else "",
         )
     
     console.print(table)
@@ -391,18 +395,18 @@ def debug():
     """Show debug information and raw API response."""
     from nba_api.stats.endpoints import leaguegamefinder
     
-    config = load_config()
+    season = load_season()
     
     console.print("[bold]Debug Info[/bold]")
-    console.print(f"Season: {config.season}")
-    console.print(f"Config path: {get_config_path()}")
+    console.print(f"Season: {season}")
+    console.print(f"Config dir: {get_config_dir()}")
     console.print(f"Calendars dir: {get_calendars_dir()}")
     
     console.print("\n[bold]Fetching sample data...[/bold]")
     
     try:
         gamefinder = leaguegamefinder.LeagueGameFinder(
-            season_nullable=config.season,
+            season_nullable=season,
             season_type_nullable="Regular Season",
             league_id_nullable="00",
         )
@@ -413,9 +417,9 @@ def debug():
         
         if len(df) > 0:
             console.print("\n[bold]Sample row:[/bold]")
-            row = df.iloc[0]
-            for col in df.columns:
-                console.print(f"  {col}: {row[col]}")
+            first = df.iloc[0].to_dict()
+            for col, val in first.items():
+                console.print(f"  {col}: {val}")
                 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
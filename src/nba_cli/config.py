@@ -1,17 +1,37 @@
 """Configuration management for NBA CLI."""
 
+import copy
+import functools
 import json
 import logging
 import os
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from pydantic import BaseModel
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+
+def json_loads(data: Union[bytes, str]):
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Encode JSON as indented UTF-8 bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
 # NBA Teams with full info
 NBA_TEAMS = {
     # Eastern Conference - Atlantic
@@ -52,13 +72,89 @@ NBA_TEAMS = {
     "SAS": {"name": "San Antonio Spurs", "full_name": "San Antonio Spurs", "conference": "West", "division": "Southwest", "id": 1610612759},
 }
 
-NBA_CONFERENCES = ["East", "West"]
+class Conference(str, Enum):
+    """NBA conference; members compare equal to their plain names."""
+
+    EAST = "East"
+    WEST = "West"
+
+
+class Division(str, Enum):
+    """NBA division; members compare equal to their plain names."""
+
+    ATLANTIC = "Atlantic"
+    CENTRAL = "Central"
+    SOUTHEAST = "Southeast"
+    NORTHWEST = "Northwest"
+    PACIFIC = "Pacific"
+    SOUTHWEST = "Southwest"
+
+
+NBA_CONFERENCES = [c.value for c in Conference]
 
 NBA_DIVISIONS = {
-    "East": ["Atlantic", "Central", "Southeast"],
-    "West": ["Northwest", "Pacific", "Southwest"],
+    Conference.EAST.value: [Division.ATLANTIC.value, Division.CENTRAL.value, Division.SOUTHEAST.value],
+    Conference.WEST.value: [Division.NORTHWEST.value, Division.PACIFIC.value, Division.SOUTHWEST.value],
+}
+
+# Catch typos in the team table at import time
+for _abbrev, _info in NBA_TEAMS.items():
+    if _info["division"] not in NBA_DIVISIONS.get(Conference(_info["conference"]).value, ()):
+        raise ValueError(f"Team {_abbrev} has unknown division {_info['division']!r}")
+del _abbrev, _info
+
+# Teams ordered by conference, division, then name for display
+NBA_TEAMS_SORTED = sorted(
+    NBA_TEAMS.items(),
+    key=lambda x: (x[1]["conference"], x[1]["division"], x[1]["name"]),
+)
+
+# NBA_TEAMS_SORTED with lowercased conference, division, name, and abbrev
+_TEAM_FILTER_KEYS: list[tuple[str, dict, str, str, str, str]] = [
+    (abbrev, info, info["conference"].lower(), info["division"].lower(), info["name"].lower(), abbrev.lower())
+    for abbrev, info in NBA_TEAMS_SORTED
+]
+
+# Case-insensitive lookups for user input
+_CONFERENCES_LOWER = {c.value.lower(): c for c in Conference}
+_DIVISIONS_LOWER = {d.value.lower(): d for d in Division}
+
+
+def parse_conference(name: str) -> Optional[Conference]:
+    """Match a conference name case-insensitively."""
+    return _CONFERENCES_LOWER.get(name.strip().lower())
+
+
+def parse_division(name: str) -> Optional[Division]:
+    """Match a division name case-insensitively."""
+    return _DIVISIONS_LOWER.get(name.strip().lower())
+
+
+# Lookup indices, built once from the static team table
+_BY_CONF: dict[str, list[tuple[str, dict]]] = {
+    conf: [(abbrev, info) for abbrev, info in NBA_TEAMS.items() if info["conference"] == conf]
+    for conf in NBA_CONFERENCES
+}
+
+_BY_DIV: dict[str, list[tuple[str, dict]]] = {
+    div: [(abbrev, info) for abbrev, info in NBA_TEAMS.items() if info["division"] == div]
+    for divs in NBA_DIVISIONS.values()
+    for div in divs
 }
 
+# Lowercased abbreviation, name, and full name -> abbreviation
+_NAME_INDEX: dict[str, str] = {
+    key.lower(): abbrev
+    for abbrev, info in NBA_TEAMS.items()
+    for key in (abbrev, info["name"], info["full_name"])
+}
+
+# (abbrev, name, full name) lowercased once for partial-name matching
+_LOWER_NAMES: list[tuple[str, str, str]] = [
+    (abbrev, info["name"].lower(), info["full_name"].lower())
+    for abbrev, info in NBA_TEAMS.items()
+]
+
 
 def get_team_by_abbrev(abbrev: str) -> Optional[dict]:
     """Get team info by abbreviation."""
@@ -68,90 +164,216 @@ def get_team_by_abbrev(abbrev: str) -> Optional[dict]:
 def get_team_by_name(name: str) -> Optional[tuple[str, dict]]:
     """Get team info by name (partial match)."""
     name_lower = name.lower()
-    for abbrev, info in NBA_TEAMS.items():
-        if (name_lower in info["name"].lower() or 
-            name_lower in info["full_name"].lower() or
-            name_lower == abbrev.lower()):
-            return abbrev, info
+    
+    # Exact abbreviation or name
+    abbrev = _NAME_INDEX.get(name_lower)
+    if abbrev:
+        return abbrev, NBA_TEAMS[abbrev]
+    
+    # Partial name
+    for abbrev, team_name, full_name in _LOWER_NAMES:
+        if name_lower in team_name or name_lower in full_name:
+            return abbrev, NBA_TEAMS[abbrev]
     return None
 
 
+def resolve_team_abbrev(name: str) -> Optional[str]:
+    """Resolve a team abbreviation or (partial) name to its abbreviation."""
+    result = get_team_by_name(name)
+    return result[0] if result else None
+
+
+def filter_teams(
+    conference: Optional[str] = None,
+    division: Optional[str] = None,
+    search: Optional[str] = None,
+) -> list[tuple[str, dict]]:
+    """
+    Get teams in display order, optionally filtered (case-insensitive).
+    
+    Args:
+        conference: Keep teams in this conference
+        division: Keep teams in this division
+        search: Keep teams whose name contains this or whose abbreviation equals it
+    """
+    conf_lc = conference.lower() if conference else None
+    div_lc = division.lower() if division else None
+    search_lc = search.lower() if search else None
+    
+    return [
+        (abbrev, info)
+        for abbrev, info, team_conf, team_div, team_name, team_abbrev in _TEAM_FILTER_KEYS
+        if not (
+            (conf_lc and team_conf != conf_lc)
+            or (div_lc and team_div != div_lc)
+            or (search_lc and search_lc not in team_name and search_lc != team_abbrev)
+        )
+    ]
+
+
 def get_teams_by_conference(conference: str) -> list[tuple[str, dict]]:
     """Get all teams in a conference."""
-    conf = conference.capitalize()
-    return [(abbrev, info) for abbrev, info in NBA_TEAMS.items() 
-            if info["conference"] == conf]
+    return list(_BY_CONF.get(conference.capitalize(), ()))
 
 
 def get_teams_by_division(division: str) -> list[tuple[str, dict]]:
     """Get all teams in a division."""
-    div = division.capitalize()
-    return [(abbrev, info) for abbrev, info in NBA_TEAMS.items() 
-            if info["division"] == div]
+    return list(_BY_DIV.get(division.capitalize(), ()))
+
+
+def _str_list(value, name: str) -> list[str]:
+    """Validate a JSON value as a list of strings."""
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"'{name}' must be a list of strings")
+    return list(value)
 
 
-class TrackedTeams(BaseModel):
-    """Teams being tracked."""
-    teams: list[str] = []  # Team abbreviations
-    conferences: list[str] = []  # East, West
-    divisions: list[str] = []  # Atlantic, Central, etc.
+@dataclass
+class TrackedTeams:
+    """
+    Teams being tracked.
+    
+    Selections are held as sets in memory and written out as sorted lists.
+    """
+    teams: set[str] = field(default_factory=set)  # Team abbreviations
+    conferences: set[str] = field(default_factory=set)  # East, West
+    divisions: set[str] = field(default_factory=set)  # Atlantic, Central, etc.
+    
+    def __post_init__(self):
+        # Accept any iterable (e.g. lists from JSON or callers)
+        self.teams = set(self.teams)
+        self.conferences = set(self.conferences)
+        self.divisions = set(self.divisions)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrackedTeams":
+        """Build from parsed JSON, ignoring unknown keys."""
+        if not isinstance(data, dict):
+            raise ValueError("'tracked' must be an object")
+        return cls(
+            teams=_str_list(data.get("teams", []), "teams"),
+            conferences=_str_list(data.get("conferences", []), "conferences"),
+            divisions=_str_list(data.get("divisions", []), "divisions"),
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert to plain JSON-compatible data."""
+        return {
+            "teams": sorted(self.teams),
+            "conferences": sorted(self.conferences),
+            "divisions": sorted(self.divisions),
+        }
     
     def is_empty(self) -> bool:
         return not self.teams and not self.conferences and not self.divisions
     
     def get_all_team_ids(self) -> list[int]:
         """Get all team IDs based on tracked teams, conferences, and divisions."""
-        team_ids = set()
-        
-        # Add directly tracked teams
-        for abbrev in self.teams:
-            team = get_team_by_abbrev(abbrev)
-            if team:
-                team_ids.add(team["id"])
-        
-        # Add teams from tracked conferences
-        for conf in self.conferences:
-            for abbrev, info in get_teams_by_conference(conf):
-                team_ids.add(info["id"])
-        
-        # Add teams from tracked divisions
-        for div in self.divisions:
-            for abbrev, info in get_teams_by_division(div):
-                team_ids.add(info["id"])
-        
-        return list(team_ids)
-
-
-class Config(BaseModel):
+        return list(_resolve_team_ids(
+            frozenset(self.teams), frozenset(self.conferences), frozenset(self.divisions),
+        ))
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_team_ids(
+    teams: frozenset[str],
+    conferences: frozenset[str],
+    divisions: frozenset[str],
+) -> tuple[int, ...]:
+    """Resolve tracked selections to team IDs; memoized per selection."""
+    team_ids = set()
+    
+    # Add directly tracked teams
+    for abbrev in teams:
+        team = get_team_by_abbrev(abbrev)
+        if team:
+            team_ids.add(team["id"])
+    
+    # Add teams from tracked conferences
+    for conf in conferences:
+        team_ids.update(info["id"] for _, info in _BY_CONF.get(conf.capitalize(), ()))
+    
+    # Add teams from tracked divisions
+    for div in divisions:
+        team_ids.update(info["id"] for _, info in _BY_DIV.get(div.capitalize(), ()))
+    
+    return tuple(team_ids)
+
+
+@dataclass
+class Config:
     """Application configuration."""
     season: str = ""  # e.g., "2024-25"
-    tracked: TrackedTeams = TrackedTeams()
+    tracked: TrackedTeams = field(default_factory=TrackedTeams)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """Build from parsed JSON, ignoring unknown keys."""
+        if not isinstance(data, dict):
+            raise ValueError("config must be an object")
+        season = data.get("season", "")
+        if not isinstance(season, str):
+            raise ValueError("'season' must be a string")
+        return cls(season=season, tracked=TrackedTeams.from_dict(data.get("tracked", {})))
+    
+    def to_dict(self) -> dict:
+        """Convert to plain JSON-compatible data."""
+        return {"season": self.season, "tracked": self.tracked.to_dict()}
     
     @classmethod
     def get_current_season(cls) -> str:
         """Get the current NBA season string."""
-        now = datetime.now()
-        # NBA season starts in October
-        if now.month >= 10:
-            return f"{now.year}-{str(now.year + 1)[2:]}"
-        else:
-            return f"{now.year - 1}-{str(now.year)[2:]}"
+        return _season_for_day(datetime.now().toordinal())
 
 
-def get_config_dir() -> Path:
-    """Get configuration directory."""
-    if os.environ.get("NBA_CLI_CONFIG"):
-        return Path(os.environ["NBA_CLI_CONFIG"]).parent
+@functools.lru_cache(maxsize=1)
+def _season_for_day(day: int) -> str:
+    """Get the NBA season string for a date ordinal; cached for the day."""
+    today = date.fromordinal(day)
+    # NBA season starts in October
+    if today.month >= 10:
+        return f"{today.year}-{str(today.year + 1)[2:]}"
+    else:
+        return f"{today.year - 1}-{str(today.year)[2:]}"
+
+
+@functools.lru_cache(maxsize=4)
+def _config_dir_for(env_config: Optional[str], config_home: Optional[str], home: Optional[str]) -> Path:
+    """Resolve the config directory; cached per distinct environment."""
+    if env_config:
+        return Path(env_config).parent
     
-    config_home = os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config"))
+    if config_home is None:
+        config_home = str(Path.home() / ".config")
     return Path(config_home) / "nba-cli"
 
 
+def get_config_dir() -> Path:
+    """Get configuration directory."""
+    env = os.environ
+    return _config_dir_for(env.get("NBA_CLI_CONFIG"), env.get("XDG_CONFIG_HOME"), env.get("HOME"))
+
+
 def get_config_path() -> Path:
-    """Get configuration file path."""
+    """Get legacy single-file configuration path (read and migrated on save)."""
     return get_config_dir() / "config.json"
 
 
+def get_season_path() -> Path:
+    """Get path of the file holding the configured season."""
+    return get_config_dir() / "season.json"
+
+
+def get_tracked_path() -> Path:
+    """Get path of the file holding tracked teams, conferences, and divisions."""
+    return get_config_dir() / "tracked.json"
+
+
+def config_exists() -> bool:
+    """Check whether any configuration has been saved."""
+    return any(p.exists() for p in (get_config_path(), get_season_path(), get_tracked_path()))
+
+
 def get_data_dir() -> Path:
     """Get data directory for calendars."""
     data_home = os.environ.get("XDG_DATA_HOME", str(Path.home() / ".local" / "share"))
@@ -163,36 +385,166 @@ def get_calendars_dir() -> Path:
     return get_data_dir() / "calendars"
 
 
-def load_config() -> Config:
-    """Load configuration from file or environment."""
+def get_cache_dir() -> Path:
+    """Get cache directory for downloaded schedule data."""
+    cache_home = os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+    return Path(cache_home) / "nba-cli"
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_config_env(raw: str) -> Config:
+    """Parse NBA_CLI_CONFIG; cached per distinct value."""
+    return Config.from_dict(json_loads(raw))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_file(path: Path, mtime_ns: int, size: int) -> Config:
+    """Parse a legacy config file; cached until the file's mtime or size changes."""
+    return Config.from_dict(json_loads(path.read_bytes()))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_season_file(path: Path, mtime_ns: int, size: int) -> str:
+    """Parse the season file; cached until the file's mtime or size changes."""
+    season = json_loads(path.read_bytes())
+    if not isinstance(season, str):
+        raise ValueError("season must be a string")
+    return season
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tracked_file(path: Path, mtime_ns: int, size: int) -> TrackedTeams:
+    """Parse the tracked file; cached until the file's mtime or size changes."""
+    return TrackedTeams.from_dict(json_loads(path.read_bytes()))
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Write bytes to path via a temp file so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """Atomically write content unless the file already holds it. Returns True if written."""
+    try:
+        if path.read_bytes() == content:
+            logger.debug(f"Unchanged, not rewriting {path}")
+            return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, content)
+    return True
+
+
+def _load_legacy_config() -> Optional[Config]:
+    """Load a combined config from NBA_CLI_CONFIG or a legacy config.json, if any."""
     # Check for environment variable (for CI/CD)
     if os.environ.get("NBA_CLI_CONFIG"):
         try:
-            data = json.loads(os.environ["NBA_CLI_CONFIG"])
-            return Config(**data)
+            return copy.deepcopy(_parse_config_env(os.environ["NBA_CLI_CONFIG"]))
         except (json.JSONDecodeError, Exception) as e:
             logger.warning(f"Failed to parse NBA_CLI_CONFIG: {e}")
     
-    # Load from file
+    # Single-file config from older versions (or written by CI)
     config_path = get_config_path()
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                data = json.load(f)
-            return Config(**data)
-        except (json.JSONDecodeError, Exception) as e:
-            logger.warning(f"Failed to load config from {config_path}: {e}")
+    try:
+        stat = config_path.stat()
+        config = _load_config_file(config_path, stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(config)
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, Exception) as e:
+        logger.warning(f"Failed to load config from {config_path}: {e}")
     
-    # Return default config
-    return Config(season=Config.get_current_season())
+    return None
+
+
+def _load_season_split() -> str:
+    """Load the season from season.json, defaulting to the current season."""
+    season_path = get_season_path()
+    try:
+        stat = season_path.stat()
+        return _load_season_file(season_path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, Exception) as e:
+        logger.warning(f"Failed to load season from {season_path}: {e}")
+    return Config.get_current_season()
+
+
+def _load_tracked_split() -> TrackedTeams:
+    """Load tracked selections from tracked.json, defaulting to none."""
+    tracked_path = get_tracked_path()
+    try:
+        stat = tracked_path.stat()
+        tracked = _load_tracked_file(tracked_path, stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(tracked)
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, Exception) as e:
+        logger.warning(f"Failed to load tracked teams from {tracked_path}: {e}")
+    return TrackedTeams()
+
+
+def load_season() -> str:
+    """Load only the configured season, without parsing tracked teams."""
+    legacy = _load_legacy_config()
+    if legacy is not None:
+        return legacy.season
+    return _load_season_split()
+
+
+def load_tracked() -> TrackedTeams:
+    """Load only the tracked teams, conferences, and divisions."""
+    legacy = _load_legacy_config()
+    if legacy is not None:
+        return legacy.tracked
+    return _load_tracked_split()
+
+
+def load_config() -> Config:
+    """
+    Load configuration from the environment or the config directory.
+    
+    NBA_CLI_CONFIG or a legacy config.json takes precedence over the split
+    season.json/tracked.json files. Parsed files are cached, and each call
+    returns fresh objects that the caller is free to mutate.
+    """
+    legacy = _load_legacy_config()
+    if legacy is not None:
+        return legacy
+    return Config(season=_load_season_split(), tracked=_load_tracked_split())
 
 
 def save_config(config: Config) -> None:
-    """Save configuration to file."""
-    config_path = get_config_path()
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    """
+    Save configuration to the config directory.
+    
+    The season and tracked selections are separate files, and each is only
+    rewritten when its contents change. A legacy config.json is migrated
+    (kept as config.json.bak) so the split files take effect.
+    """
+    config_dir = get_config_dir()
+    config_dir.mkdir(parents=True, exist_ok=True)
+    
+    written = [
+        path
+        for path, payload in (
+            (get_season_path(), json_dumps(config.season)),
+            (get_tracked_path(), json_dumps(config.tracked.to_dict())),
+        )
+        if _write_if_changed(path, payload)
+    ]
+    
+    legacy_path = get_config_path()
+    if legacy_path.exists():
+        os.replace(legacy_path, legacy_path.with_name(legacy_path.name + ".bak"))
+        logger.info(f"Migrated {legacy_path} to {config_dir}")
     
-    with open(config_path, "w") as f:
-        json.dump(config.model_dump(), f, indent=2)
+    _load_config_file.cache_clear()
+    _load_season_file.cache_clear()
+    _load_tracked_file.cache_clear()
     
-    logger.info(f"Saved config to {config_path}")
+    for path in written:
+        logger.info(f"Saved config to {path}")